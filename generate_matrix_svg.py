@@ -1,11 +1,16 @@
 import argparse
 import random
-import xml.etree.ElementTree as ET
-from copy import deepcopy
+import re
+import sys
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator
 from enum import StrEnum
+from functools import lru_cache
 from itertools import batched, cycle, islice
 from textwrap import dedent
-from typing import Optional
+from typing import NamedTuple, Optional
+from xml.sax.saxutils import escape
 
 VERTICAL_SPEED_FACTOR = 1.45
 
@@ -54,9 +59,19 @@ DC_NS = "http://purl.org/dc/elements/1.1/"
 CC_NS = "http://creativecommons.org/ns#"
 RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
 
-ET.register_namespace("dc", DC_NS)
-ET.register_namespace("cc", CC_NS)
-ET.register_namespace("rdf", RDF_NS)
+INTER_TAG_WHITESPACE = re.compile(r">\s+<")
+
+# Static closing markup shared by every per-glyph animation element; appended
+# as-is so the glyph loop allocates nothing for it.
+ANIMATE_CLOSE = 's" repeatCount="indefinite" />'
+ADDITIVE_ANIMATE_CLOSE = 's" repeatCount="indefinite" additive="sum" />'
+
+# Whitespace placed before column, inner group, glyph and animation tags of
+# the rain, keyed by the ``pretty`` flag.
+RAIN_SEPARATORS = {
+    False: ("", "", "", ""),
+    True: ("\n    ", "\n      ", "\n        ", "\n          "),
+}
 
 STYLE_TEXT = dedent(
     """
@@ -78,183 +93,113 @@ TRAIL_COLOR_MATRIX_VALUES = dedent(
 ).strip()
 
 
-def ns_tag(namespace: str, tag: str) -> str:
-    return f"{{{namespace}}}{tag}"
+class SvgWriter:
+    """Pass markup through to ``write`` and lay out the direct children of ``<svg>``.
 
+    ``write`` is any callable taking a string, e.g. ``sys.stdout.write`` or
+    ``list.append``; with ``pretty`` each section starts on its own indented line.
+    """
 
-def indent(elem: ET.Element, level: int = 0) -> None:
-    spacing = "\n" + level * "  "
-    if len(elem):
-        if not elem.text or not elem.text.strip():
-            elem.text = spacing + "  "
-        for child in elem:
-            indent(child, level + 1)
-            if not child.tail or not child.tail.strip():
-                child.tail = spacing + "  "
-        if not elem[-1].tail or not elem[-1].tail.strip():
-            elem[-1].tail = spacing
-    else:
-        if level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = spacing
+    def __init__(self, write: Callable[[str], object], pretty: bool = False) -> None:
+        self.write = write
+        self.pretty = pretty
+        self.section_sep = "\n  " if pretty else ""
+
+    def section(self, markup: str) -> None:
+        """Write ``markup`` as the next direct child of ``<svg>``."""
+
+        self.write(self.section_sep)
+        self.write(markup)
+
+
+# The metadata and style sections never change between runs, and the defs
+# entries only vary in which of them are included, so they are kept
+# pre-serialized, laid out as direct children of ``<svg>`` under --pretty.
+METADATA_MARKUP = f"""<metadata xmlns:cc="{CC_NS}" xmlns:dc="{DC_NS}" xmlns:rdf="{RDF_NS}">
+    <rdf:RDF>
+      <cc:Work rdf:about="">
+        <dc:title>Matrix Rain Glyph Cascade</dc:title>
+        <dc:creator>Shane Macaulay (K2)</dc:creator>
+        <dc:identifier>https://github.com/K2</dc:identifier>
+        <dc:description>Animated matrix-style glyph rainfall generated via DeepSeek-OCR assets pipeline.</dc:description>
+        <dc:rights>© 2025 Shane Macaulay (K2) — Noncommercial use only. Contact ktwo@ktwo.ca.</dc:rights>
+        <dc:language>en</dc:language>
+        <cc:license rdf:resource="https://creativecommons.org/licenses/by-nc/4.0/" />
+      </cc:Work>
+      <cc:License rdf:about="https://creativecommons.org/licenses/by-nc/4.0/">
+        <cc:permits rdf:resource="https://creativecommons.org/ns#Reproduction" />
+        <cc:permits rdf:resource="https://creativecommons.org/ns#Distribution" />
+        <cc:permits rdf:resource="https://creativecommons.org/ns#DerivativeWorks" />
+        <cc:requires rdf:resource="https://creativecommons.org/ns#Attribution" />
+        <cc:prohibits rdf:resource="https://creativecommons.org/ns#CommercialUse" />
+      </cc:License>
+    </rdf:RDF>
+  </metadata>"""
+
+STYLE_MARKUP = f"<style>\n{STYLE_TEXT}\n</style>"
+
+# Paint servers and filters for <defs>, keyed by id in document order; each is
+# laid out as a child of ``<defs>``.
+DEFS_ENTRIES = {
+    "gradGlow": """<linearGradient id="gradGlow" gradientUnits="userSpaceOnUse" x1="0" y1="0" x2="0" y2="500">
+      <stop offset="0%" stop-color="#9AFF9A" />
+      <stop offset="60%" stop-color="#31FF6B" />
+      <stop offset="100%" stop-color="#00BF47" />
+    </linearGradient>""",
+    "gradBolt": """<linearGradient id="gradBolt" gradientUnits="userSpaceOnUse" x1="0" y1="0" x2="0" y2="500">
+      <stop offset="0%" stop-color="#FFB347" />
+      <stop offset="60%" stop-color="#FF6A00" />
+      <stop offset="100%" stop-color="#FF2400" />
+    </linearGradient>""",
+    "softGlow": """<filter id="softGlow" x="-40%" y="-40%" width="180%" height="180%">
+      <feGaussianBlur stdDeviation="2.2" result="blur" />
+      <feMerge>
+        <feMergeNode in="blur" />
+        <feMergeNode in="SourceGraphic" />
+      </feMerge>
+    </filter>""",
+    "trailGlow": f"""<filter id="trailGlow" x="-40%" y="-40%" width="180%" height="220%">
+      <feGaussianBlur in="SourceGraphic" stdDeviation="0 7" result="trail" />
+      <feColorMatrix in="trail" type="matrix" values="{TRAIL_COLOR_MATRIX_VALUES.replace(chr(10), "&#10;")}" result="trailFade" />
+      <feMerge>
+        <feMergeNode in="trailFade" />
+        <feMergeNode in="SourceGraphic" />
+      </feMerge>
+    </filter>""",
+    "vignette": """<radialGradient id="vignette" cx="50%" cy="50%" r="65%">
+      <stop offset="0%" stop-color="rgba(0,0,0,0)" />
+      <stop offset="100%" stop-color="rgba(0,0,0,0.55)" />
+    </radialGradient>""",
+    "flashGlow": """<radialGradient id="flashGlow" cx="50%" cy="50%" r="75%">
+      <stop offset="0%" stop-color="#FFB347" stop-opacity="0.85" />
+      <stop offset="55%" stop-color="#FF5F1F" stop-opacity="0.45" />
+      <stop offset="100%" stop-color="#FF2400" stop-opacity="0" />
+    </radialGradient>""",
+}
 
+# Defs referenced only by the lightning overlay or by the rain's trail filter.
+LIGHTNING_DEF_IDS = frozenset({"gradBolt", "softGlow", "flashGlow"})
+TRAIL_DEF_IDS = frozenset({"trailGlow"})
 
-def build_metadata() -> ET.Element:
-    metadata = ET.Element("metadata")
-    rdf_root = ET.SubElement(metadata, ns_tag(RDF_NS, "RDF"))
 
-    work = ET.SubElement(
-        rdf_root,
-        ns_tag(CC_NS, "Work"),
-        {ns_tag(RDF_NS, "about"): ""},
-    )
-    ET.SubElement(work, ns_tag(DC_NS, "title")).text = "Matrix Rain Glyph Cascade"
-    ET.SubElement(work, ns_tag(DC_NS, "creator")).text = "Shane Macaulay (K2)"
-    ET.SubElement(work, ns_tag(DC_NS, "identifier")).text = "https://github.com/K2"
-    ET.SubElement(
-        work,
-        ns_tag(DC_NS, "description"),
-    ).text = (
-        "Animated matrix-style glyph rainfall generated via DeepSeek-OCR assets pipeline."
-    )
-    ET.SubElement(
-        work,
-        ns_tag(DC_NS, "rights"),
-    ).text = "© 2025 Shane Macaulay (K2) — Noncommercial use only. Contact ktwo@ktwo.ca."
-    ET.SubElement(work, ns_tag(DC_NS, "language")).text = "en"
-    ET.SubElement(
-        work,
-        ns_tag(CC_NS, "license"),
-        {ns_tag(RDF_NS, "resource"): "https://creativecommons.org/licenses/by-nc/4.0/"},
-    )
+def layout_variants(markup: str) -> dict[bool, str]:
+    """Map the ``pretty`` flag to ``markup`` as written or with inter-tag whitespace removed."""
 
-    license_elem = ET.SubElement(
-        rdf_root,
-        ns_tag(CC_NS, "License"),
-        {ns_tag(RDF_NS, "about"): "https://creativecommons.org/licenses/by-nc/4.0/"},
-    )
-    for resource in (
-        "https://creativecommons.org/ns#Reproduction",
-        "https://creativecommons.org/ns#Distribution",
-        "https://creativecommons.org/ns#DerivativeWorks",
-    ):
-        ET.SubElement(
-            license_elem,
-            ns_tag(CC_NS, "permits"),
-            {ns_tag(RDF_NS, "resource"): resource},
-        )
-    ET.SubElement(
-        license_elem,
-        ns_tag(CC_NS, "requires"),
-        {ns_tag(RDF_NS, "resource"): "https://creativecommons.org/ns#Attribution"},
-    )
-    ET.SubElement(
-        license_elem,
-        ns_tag(CC_NS, "prohibits"),
-        {ns_tag(RDF_NS, "resource"): "https://creativecommons.org/ns#CommercialUse"},
-    )
-    return metadata
+    return {True: markup, False: INTER_TAG_WHITESPACE.sub("><", markup)}
 
 
-def build_style() -> ET.Element:
-    style_elem = ET.Element("style")
-    style_elem.text = "\n" + STYLE_TEXT + "\n"
-    return style_elem
+METADATA_SECTION = layout_variants(METADATA_MARKUP)
+STYLE_SECTION = layout_variants(STYLE_MARKUP)
 
 
-def build_defs() -> ET.Element:
-    defs = ET.Element("defs")
+BACKGROUND_RECT_TEMPLATE = '<rect x="0" y="0" width="{width}" height="500" fill="{fill}" />'
+BACKGROUND_FILLS = ("#050507", "url(#vignette)")
 
-    grad_glow = ET.SubElement(
-        defs,
-        "linearGradient",
-        {"id": "gradGlow", "gradientUnits": "userSpaceOnUse", "x1": "0", "y1": "0", "x2": "0", "y2": "500"},
-    )
-    ET.SubElement(grad_glow, "stop", {"offset": "0%", "stop-color": "#9AFF9A"})
-    ET.SubElement(grad_glow, "stop", {"offset": "60%", "stop-color": "#31FF6B"})
-    ET.SubElement(grad_glow, "stop", {"offset": "100%", "stop-color": "#00BF47"})
-
-    grad_bolt = ET.SubElement(
-        defs,
-        "linearGradient",
-        {"id": "gradBolt", "gradientUnits": "userSpaceOnUse", "x1": "0", "y1": "0", "x2": "0", "y2": "500"},
-    )
-    ET.SubElement(grad_bolt, "stop", {"offset": "0%", "stop-color": "#FFB347"})
-    ET.SubElement(grad_bolt, "stop", {"offset": "60%", "stop-color": "#FF6A00"})
-    ET.SubElement(grad_bolt, "stop", {"offset": "100%", "stop-color": "#FF2400"})
-
-    soft_glow = ET.SubElement(
-        defs,
-        "filter",
-        {"id": "softGlow", "x": "-40%", "y": "-40%", "width": "180%", "height": "180%"},
-    )
-    ET.SubElement(soft_glow, "feGaussianBlur", {"stdDeviation": "2.2", "result": "blur"})
-    merge = ET.SubElement(soft_glow, "feMerge")
-    ET.SubElement(merge, "feMergeNode", {"in": "blur"})
-    ET.SubElement(merge, "feMergeNode", {"in": "SourceGraphic"})
-
-    trail_glow = ET.SubElement(
-        defs,
-        "filter",
-        {"id": "trailGlow", "x": "-40%", "y": "-40%", "width": "180%", "height": "220%"},
-    )
-    ET.SubElement(
-        trail_glow,
-        "feGaussianBlur",
-        {"in": "SourceGraphic", "stdDeviation": "0 7", "result": "trail"},
-    )
-    ET.SubElement(
-        trail_glow,
-        "feColorMatrix",
-        {"in": "trail", "type": "matrix", "values": TRAIL_COLOR_MATRIX_VALUES, "result": "trailFade"},
-    )
-    trail_merge = ET.SubElement(trail_glow, "feMerge")
-    ET.SubElement(trail_merge, "feMergeNode", {"in": "trailFade"})
-    ET.SubElement(trail_merge, "feMergeNode", {"in": "SourceGraphic"})
-
-    vignette = ET.SubElement(
-        defs,
-        "radialGradient",
-        {"id": "vignette", "cx": "50%", "cy": "50%", "r": "65%"},
-    )
-    ET.SubElement(vignette, "stop", {"offset": "0%", "stop-color": "rgba(0,0,0,0)"})
-    ET.SubElement(vignette, "stop", {"offset": "100%", "stop-color": "rgba(0,0,0,0.55)"})
 
-    flash_glow = ET.SubElement(
-        defs,
-        "radialGradient",
-        {"id": "flashGlow", "cx": "50%", "cy": "50%", "r": "75%"},
-    )
-    ET.SubElement(
-        flash_glow,
-        "stop",
-        {"offset": "0%", "stop-color": "#FFB347", "stop-opacity": "0.85"},
-    )
-    ET.SubElement(
-        flash_glow,
-        "stop",
-        {"offset": "55%", "stop-color": "#FF5F1F", "stop-opacity": "0.45"},
-    )
-    ET.SubElement(
-        flash_glow,
-        "stop",
-        {"offset": "100%", "stop-color": "#FF2400", "stop-opacity": "0"},
-    )
-
-    return defs
-
-
-def add_background_rects(svg_root: ET.Element, canvas_width: float) -> None:
+def build_background_rects(out: SvgWriter, canvas_width: float) -> None:
     width_text = fmt_num(canvas_width)
-    ET.SubElement(
-        svg_root,
-        "rect",
-        {"x": "0", "y": "0", "width": width_text, "height": "500", "fill": "#050507"},
-    )
-    ET.SubElement(
-        svg_root,
-        "rect",
-        {"x": "0", "y": "0", "width": width_text, "height": "500", "fill": "url(#vignette)"},
-    )
+    for fill in BACKGROUND_FILLS:
+        out.section(BACKGROUND_RECT_TEMPLATE.format(width=width_text, fill=fill))
 
 
 LIGHTNING_POINTS_BASE = [
@@ -267,323 +212,310 @@ LIGHTNING_POINTS_BASE = [
     (246, 560),
 ]
 
+# Only the flash width and the bolt's points depend on the canvas.
+LIGHTNING_TEMPLATE = """<g id="lightning" pointer-events="none">
+    <rect x="0" y="0" width="{width}" height="500" fill="url(#flashGlow)" opacity="0">
+      <animate attributeName="opacity" values="0;0;0.88;0" keyTimes="0;0.8;0.84;1" dur="12s" repeatCount="indefinite" />
+    </rect>
+    <polyline points="{points}" stroke="url(#gradBolt)" stroke-width="12" stroke-linecap="round" stroke-linejoin="round" fill="none" opacity="0" filter="url(#softGlow)">
+      <animate attributeName="opacity" values="0;0;1;0" keyTimes="0;0.82;0.86;1" dur="12s" repeatCount="indefinite" />
+      <animate attributeName="stroke-width" values="12;16;12" dur="12s" begin="-0.4s" repeatCount="indefinite" />
+      <animate attributeName="stroke-dashoffset" values="0;-140;0" dur="0.9s" repeatCount="indefinite" />
+    </polyline>
+  </g>"""
+
+LIGHTNING_SECTION = layout_variants(LIGHTNING_TEMPLATE)
+
+
+@lru_cache(maxsize=None)
+def defs_section(include_trail: bool, include_lightning: bool, pretty: bool = False) -> str:
+    """Assemble ``<defs>`` from only the entries the document will reference."""
+
+    unused = set()
+    if not include_trail:
+        unused |= TRAIL_DEF_IDS
+    if not include_lightning:
+        unused |= LIGHTNING_DEF_IDS
+    markup = "<defs>{}\n  </defs>".format(
+        "".join(
+            "\n    " + entry for def_id, entry in DEFS_ENTRIES.items() if def_id not in unused
+        )
+    )
+    return layout_variants(markup)[pretty]
+
 
-def build_lightning(canvas_width: float) -> ET.Element:
+def build_lightning(out: SvgWriter, canvas_width: float) -> None:
     width_scale = (
         canvas_width / LIGHTNING_REFERENCE_WIDTH if LIGHTNING_REFERENCE_WIDTH else 1.0
     )
     points = " ".join(
-        f"{fmt_num(x * width_scale)},{fmt_num(y)}" for x, y in LIGHTNING_POINTS_BASE
-    )
-
-    lightning = ET.Element("g", {"id": "lightning", "pointer-events": "none"})
-
-    rect = ET.SubElement(
-        lightning,
-        "rect",
-        {
-            "x": "0",
-            "y": "0",
-            "width": fmt_num(canvas_width),
-            "height": "500",
-            "fill": "url(#flashGlow)",
-            "opacity": "0",
-        },
-    )
-    ET.SubElement(
-        rect,
-        "animate",
-        {
-            "attributeName": "opacity",
-            "values": "0;0;0.88;0",
-            "keyTimes": "0;0.8;0.84;1",
-            "dur": "12s",
-            "repeatCount": "indefinite",
-        },
+        fmt_point(x * width_scale, y) for x, y in LIGHTNING_POINTS_BASE
     )
+    out.section(LIGHTNING_SECTION[out.pretty].format(width=fmt_num(canvas_width), points=points))
 
-    polyline = ET.SubElement(
-        lightning,
-        "polyline",
-        {
-            "points": points,
-            "stroke": "url(#gradBolt)",
-            "stroke-width": "12",
-            "stroke-linecap": "round",
-            "stroke-linejoin": "round",
-            "fill": "none",
-            "opacity": "0",
-            "filter": "url(#softGlow)",
-        },
-    )
-    ET.SubElement(
-        polyline,
-        "animate",
-        {
-            "attributeName": "opacity",
-            "values": "0;0;1;0",
-            "keyTimes": "0;0.82;0.86;1",
-            "dur": "12s",
-            "repeatCount": "indefinite",
-        },
-    )
-    ET.SubElement(
-        polyline,
-        "animate",
-        {
-            "attributeName": "stroke-width",
-            "values": "12;16;12",
-            "dur": "12s",
-            "begin": "-0.4s",
-            "repeatCount": "indefinite",
-        },
-    )
-    ET.SubElement(
-        polyline,
-        "animate",
-        {
-            "attributeName": "stroke-dashoffset",
-            "values": "0;-140;0",
-            "dur": "0.9s",
-            "repeatCount": "indefinite",
-        },
-    )
 
-    return lightning
+# Level N disables the first N features of NICE_FEATURE_ORDER. The dicts are
+# shared between calls, so callers must treat them as read-only.
+NICE_FLAGS_BY_LEVEL = tuple(
+    {feature: idx < level for idx, feature in enumerate(NICE_FEATURE_ORDER)}
+    for level in range(MAX_NICE_LEVEL + 1)
+)
 
 
 def resolve_nice_flags(requested_level: int):
-    """Clamp the requested nice level and derive which features to disable."""
+    """Clamp the requested nice level and look up which features to disable."""
 
     level = max(0, min(requested_level, MAX_NICE_LEVEL))
-    flags = {feature: False for feature in NICE_FEATURE_ORDER}
-
-    for idx, feature in enumerate(NICE_FEATURE_ORDER, start=1):
-        if level >= idx:
-            flags[feature] = True
-
-    return level, flags
-
-patterns = [
-    {
-        "fill_values": "0.3;0.95;0.3",
-        "fill_dur": 2.6,
-        "fill_begin": -0.9,
-        "transform_values": "0,-8;0,4;0,-5;0,-8",
-        "transform_dur": 3.4,
-        "transform_begin": -0.5,
-        "size_dur": 4.0,
-        "size_begin": -1.1,
-        "size_high": 1.0,
-        "size_low": -1.0,
-    },
-    {
-        "fill_values": "0.25;0.88;0.28;0.25",
-        "fill_dur": 2.2,
-        "fill_begin": -1.6,
-        "transform_values": "0,-6;0,2;0,-4;0,-6",
-        "transform_dur": 2.9,
-        "transform_begin": -0.7,
-        "size_dur": 3.3,
-        "size_begin": -0.8,
-        "size_high": 1.2,
-        "size_low": -0.8,
-    },
-    {
-        "fill_values": "0.2;0.92;0.2",
-        "fill_dur": 3.1,
-        "fill_begin": -0.4,
-        "transform_values": "0,-10;0,5;0,-3;0,-10",
-        "transform_dur": 3.6,
-        "transform_begin": -1.2,
-        "size_dur": 3.7,
-        "size_begin": -1.4,
-        "size_high": 0.8,
-        "size_low": -1.2,
-    },
-    {
-        "fill_values": "0.34;0.9;0.34",
-        "fill_dur": 2.4,
-        "fill_begin": -1.2,
-        "transform_values": "0,-7;0,3;0,-6;0,-7",
-        "transform_dur": 3.0,
-        "transform_begin": -0.3,
-        "size_dur": 3.5,
-        "size_begin": -1.0,
-        "size_high": 1.0,
-        "size_low": -0.5,
-    },
-    {
-        "fill_values": "0.18;0.82;0.24;0.18",
-        "fill_dur": 4.8,
-        "fill_begin": -2.1,
-        "transform_values": "0,-5;0,6;0,-7;0,-5",
-        "transform_dur": 6.3,
-        "transform_begin": -1.8,
-        "size_dur": 4.9,
-        "size_begin": -2.2,
-        "size_high": 1.6,
-        "size_low": -1.3,
-    },
-    {
-        "fill_values": "0.4;1;0.5;0.4",
-        "fill_dur": 1.7,
-        "fill_begin": -0.65,
-        "transform_values": "0,-14;0,3;0,-9;0,-14",
-        "transform_dur": 2.1,
-        "transform_begin": -0.95,
-        "size_dur": 2.4,
-        "size_begin": -0.7,
-        "size_high": 0.6,
-        "size_low": -1.8,
-    },
-    {
-        "fill_values": "0.22;0.9;0.3;0.22",
-        "fill_dur": 5.6,
-        "fill_begin": -2.8,
-        "transform_values": "0,-6;0,5;0,-8;0,-6",
-        "transform_dur": 6.8,
-        "transform_begin": -2.4,
-        "size_dur": 5.4,
-        "size_begin": -2.6,
-        "size_high": 1.8,
-        "size_low": -1.5,
-    },
-    {
-        "fill_values": "0.32;0.96;0.4;0.32",
-        "fill_dur": 1.4,
-        "fill_begin": -0.35,
-        "transform_values": "0,-18;0,8;0,-11;0,-18",
-        "transform_dur": 1.9,
-        "transform_begin": -0.55,
-        "size_dur": 2.1,
-        "size_begin": -0.6,
-        "size_high": 0.9,
-        "size_low": -2.1,
-    },
+    return level, NICE_FLAGS_BY_LEVEL[level]
+
+class Pattern(NamedTuple):
+    """Per-glyph shimmer, jitter and scale timings cycled across each column."""
+
+    fill_values: str
+    fill_dur: float
+    fill_begin: float
+    transform_values: str
+    transform_dur: float
+    transform_begin: float
+    size_dur: float
+    size_begin: float
+    size_high: float
+    size_low: float
+
+
+class Column(NamedTuple):
+    """One vertical strand: position, fall/opacity timings and its glyph run."""
+
+    x: float
+    translate_values: str
+    translate_dur: float
+    translate_begin: float
+    opacity_values: str
+    opacity_dur: float
+    opacity_begin: float
+    glyphs: list[tuple[str, int]]
+
+
+patterns: list[Pattern] = [
+    Pattern(
+        fill_values="0.3;0.95;0.3",
+        fill_dur=2.6,
+        fill_begin=-0.9,
+        transform_values="0,-8;0,4;0,-5;0,-8",
+        transform_dur=3.4,
+        transform_begin=-0.5,
+        size_dur=4.0,
+        size_begin=-1.1,
+        size_high=1.0,
+        size_low=-1.0,
+    ),
+    Pattern(
+        fill_values="0.25;0.88;0.28;0.25",
+        fill_dur=2.2,
+        fill_begin=-1.6,
+        transform_values="0,-6;0,2;0,-4;0,-6",
+        transform_dur=2.9,
+        transform_begin=-0.7,
+        size_dur=3.3,
+        size_begin=-0.8,
+        size_high=1.2,
+        size_low=-0.8,
+    ),
+    Pattern(
+        fill_values="0.2;0.92;0.2",
+        fill_dur=3.1,
+        fill_begin=-0.4,
+        transform_values="0,-10;0,5;0,-3;0,-10",
+        transform_dur=3.6,
+        transform_begin=-1.2,
+        size_dur=3.7,
+        size_begin=-1.4,
+        size_high=0.8,
+        size_low=-1.2,
+    ),
+    Pattern(
+        fill_values="0.34;0.9;0.34",
+        fill_dur=2.4,
+        fill_begin=-1.2,
+        transform_values="0,-7;0,3;0,-6;0,-7",
+        transform_dur=3.0,
+        transform_begin=-0.3,
+        size_dur=3.5,
+        size_begin=-1.0,
+        size_high=1.0,
+        size_low=-0.5,
+    ),
+    Pattern(
+        fill_values="0.18;0.82;0.24;0.18",
+        fill_dur=4.8,
+        fill_begin=-2.1,
+        transform_values="0,-5;0,6;0,-7;0,-5",
+        transform_dur=6.3,
+        transform_begin=-1.8,
+        size_dur=4.9,
+        size_begin=-2.2,
+        size_high=1.6,
+        size_low=-1.3,
+    ),
+    Pattern(
+        fill_values="0.4;1;0.5;0.4",
+        fill_dur=1.7,
+        fill_begin=-0.65,
+        transform_values="0,-14;0,3;0,-9;0,-14",
+        transform_dur=2.1,
+        transform_begin=-0.95,
+        size_dur=2.4,
+        size_begin=-0.7,
+        size_high=0.6,
+        size_low=-1.8,
+    ),
+    Pattern(
+        fill_values="0.22;0.9;0.3;0.22",
+        fill_dur=5.6,
+        fill_begin=-2.8,
+        transform_values="0,-6;0,5;0,-8;0,-6",
+        transform_dur=6.8,
+        transform_begin=-2.4,
+        size_dur=5.4,
+        size_begin=-2.6,
+        size_high=1.8,
+        size_low=-1.5,
+    ),
+    Pattern(
+        fill_values="0.32;0.96;0.4;0.32",
+        fill_dur=1.4,
+        fill_begin=-0.35,
+        transform_values="0,-18;0,8;0,-11;0,-18",
+        transform_dur=1.9,
+        transform_begin=-0.55,
+        size_dur=2.1,
+        size_begin=-0.6,
+        size_high=0.9,
+        size_low=-2.1,
+    ),
 ]
 
-base_columns = [
-    {
-        "x": 20,
-        "translate_values": "0,-260;0,540",
-        "translate_dur": 4.2,
-        "translate_begin": -1.4,
-        "opacity_values": "0.2;0.95;0.2",
-        "opacity_dur": 4.2,
-        "opacity_begin": -1.4,
-        "glyphs": [("A", 18), ("Σ", 20), ("7", 21), ("Ω", 19), ("Ñ", 18), ("@", 21), ("Z", 23), ("É", 19), ("?", 18), ("δ", 17), ("∞", 20)],
-    },
-    {
-        "x": 60,
-        "translate_values": "0,-300;0,520",
-        "translate_dur": 5.1,
-        "translate_begin": -0.8,
-        "opacity_values": "0.18;1;0.18",
-        "opacity_dur": 5.1,
-        "opacity_begin": -0.8,
-        "glyphs": [("ß", 18), ("M", 21), ("鶴", 22), ("λ", 19), ("Ü", 18), ("鶴", 20), ("Q", 23), ("ß", 19), ("3", 18), ("η", 17), ("≈", 20)],
-    },
-    {
-        "x": 100,
-        "translate_values": "0,-240;0,520",
-        "translate_dur": 4.7,
-        "translate_begin": -2.3,
-        "opacity_values": "0.25;0.9;0.25",
-        "opacity_dur": 4.7,
-        "opacity_begin": -2.3,
-        "glyphs": [("C", 18), ("S", 20), ("%", 22), ("Ψ", 19), ("Í", 17), ("5", 21), ("T", 23), ("χ", 19), ("8", 18), ("κ", 17), ("∈", 20)],
-    },
-    {
-        "x": 140,
-        "translate_values": "0,-320;0,520",
-        "translate_dur": 5.4,
-        "translate_begin": -0.4,
-        "opacity_values": "0.18;0.92;0.18",
-        "opacity_dur": 5.4,
-        "opacity_begin": -0.4,
-        "glyphs": [("D", 18), ("L", 21), ("$", 22), ("β", 19), ("Ó", 17), ("1", 21), ("P", 23), ("Ξ", 19), ("6", 18), ("ϑ", 17), ("∮", 20)],
-    },
-    {
-        "x": 180,
-        "translate_values": "0,-260;0,560",
-        "translate_dur": 4.1,
-        "translate_begin": -1.9,
-        "opacity_values": "0.26;0.9;0.26",
-        "opacity_dur": 4.1,
-        "opacity_begin": -1.9,
-        "glyphs": [("E", 18), ("V", 21), ("0", 22), ("Γ", 19), ("Ú", 17), ("2", 21), ("F", 23), ("Ζ", 19), ("4", 18), ("θ", 17), ("∟", 20)],
-    },
-    {
-        "x": 220,
-        "translate_values": "0,-300;0,560",
-        "translate_dur": 5.8,
-        "translate_begin": -3.2,
-        "opacity_values": "0.17;0.95;0.17",
-        "opacity_dur": 5.8,
-        "opacity_begin": -3.2,
-        "glyphs": [("F", 18), ("X", 21), ("!", 22), ("Φ", 19), ("Å", 17), ("%", 21), ("N", 23), ("Π", 19), ("œ", 18), ("μ", 17), ("∴", 20)],
-    },
-    {
-        "x": 260,
-        "translate_values": "0,-260;0,520",
-        "translate_dur": 4.4,
-        "translate_begin": -0.2,
-        "opacity_values": "0.24;0.93;0.24",
-        "opacity_dur": 4.4,
-        "opacity_begin": -0.2,
-        "glyphs": [("G", 18), ("Y", 21), ("@", 22), ("Υ", 19), ("Í", 17), ("ρ", 21), ("Æ", 23), ("W", 19), ("ħ", 18), ("ξ", 17), ("∠", 20)],
-    },
-    {
-        "x": 300,
-        "translate_values": "0,-280;0,560",
-        "translate_dur": 5.0,
-        "translate_begin": -1.1,
-        "opacity_values": "0.2;0.97;0.2",
-        "opacity_dur": 5.0,
-        "opacity_begin": -1.1,
-        "glyphs": [("ñ", 18), ("T", 21), ("8", 22), ("ϖ", 19), ("Ê", 17), ("σ", 21), ("Ğ", 23), ("V", 19), ("ň", 18), ("ς", 17), ("∵", 20)],
-    },
-    {
-        "x": 340,
-        "translate_values": "0,-240;0,520",
-        "translate_dur": 4.3,
-        "translate_begin": -2.7,
-        "opacity_values": "0.22;0.92;0.22",
-        "opacity_dur": 4.3,
-        "opacity_begin": -2.7,
-        "glyphs": [("I", 18), ("P", 21), ("6", 22), ("ϱ", 19), ("Ë", 17), ("ϙ", 21), ("Ð", 23), ("U", 19), ("ŕ", 18), ("Ϟ", 17), ("∗", 20)],
-    },
-    {
-        "x": 380,
-        "translate_values": "0,-320;0,560",
-        "translate_dur": 5.6,
-        "translate_begin": -1.5,
-        "opacity_values": "0.19;0.96;0.19",
-        "opacity_dur": 5.6,
-        "opacity_begin": -1.5,
-        "glyphs": [("¿", 18), ("N", 21), ("5", 22), ("ϗ", 19), ("Ę", 17), ("ϛ", 21), ("Ç", 23), ("R", 19), ("ś", 18), ("ϟ", 17), ("∯", 20)],
-    },
-    {
-        "x": 420,
-        "translate_values": "0,-260;0,520",
-        "translate_dur": 4.5,
-        "translate_begin": -0.9,
-        "opacity_values": "0.24;0.9;0.24",
-        "opacity_dur": 4.5,
-        "opacity_begin": -0.9,
-        "glyphs": [("K", 18), ("C", 21), ("4", 22), ("Ϥ", 19), ("Ě", 17), ("ϝ", 21), ("Ō", 23), ("S", 19), ("ž", 18), ("ϡ", 17), ("∼", 20)],
-    },
-    {
-        "x": 460,
-        "translate_values": "0,-300;0,560",
-        "translate_dur": 5.2,
-        "translate_begin": -2.5,
-        "opacity_values": "0.21;0.94;0.21",
-        "opacity_dur": 5.2,
-        "opacity_begin": -2.5,
-        "glyphs": [("ψ", 18), ("E", 21), ("3", 22), ("Θ", 19), ("Á", 17), ("Δ", 21), ("Š", 23), ("T", 19), ("ñ", 18), ("β", 17), ("⊕", 20)],
-    },
+base_columns: list[Column] = [
+    Column(
+        x=20,
+        translate_values="0,-260;0,540",
+        translate_dur=4.2,
+        translate_begin=-1.4,
+        opacity_values="0.2;0.95;0.2",
+        opacity_dur=4.2,
+        opacity_begin=-1.4,
+        glyphs=[("A", 18), ("Σ", 20), ("7", 21), ("Ω", 19), ("Ñ", 18), ("@", 21), ("Z", 23), ("É", 19), ("?", 18), ("δ", 17), ("∞", 20)],
+    ),
+    Column(
+        x=60,
+        translate_values="0,-300;0,520",
+        translate_dur=5.1,
+        translate_begin=-0.8,
+        opacity_values="0.18;1;0.18",
+        opacity_dur=5.1,
+        opacity_begin=-0.8,
+        glyphs=[("ß", 18), ("M", 21), ("鶴", 22), ("λ", 19), ("Ü", 18), ("鶴", 20), ("Q", 23), ("ß", 19), ("3", 18), ("η", 17), ("≈", 20)],
+    ),
+    Column(
+        x=100,
+        translate_values="0,-240;0,520",
+        translate_dur=4.7,
+        translate_begin=-2.3,
+        opacity_values="0.25;0.9;0.25",
+        opacity_dur=4.7,
+        opacity_begin=-2.3,
+        glyphs=[("C", 18), ("S", 20), ("%", 22), ("Ψ", 19), ("Í", 17), ("5", 21), ("T", 23), ("χ", 19), ("8", 18), ("κ", 17), ("∈", 20)],
+    ),
+    Column(
+        x=140,
+        translate_values="0,-320;0,520",
+        translate_dur=5.4,
+        translate_begin=-0.4,
+        opacity_values="0.18;0.92;0.18",
+        opacity_dur=5.4,
+        opacity_begin=-0.4,
+        glyphs=[("D", 18), ("L", 21), ("$", 22), ("β", 19), ("Ó", 17), ("1", 21), ("P", 23), ("Ξ", 19), ("6", 18), ("ϑ", 17), ("∮", 20)],
+    ),
+    Column(
+        x=180,
+        translate_values="0,-260;0,560",
+        translate_dur=4.1,
+        translate_begin=-1.9,
+        opacity_values="0.26;0.9;0.26",
+        opacity_dur=4.1,
+        opacity_begin=-1.9,
+        glyphs=[("E", 18), ("V", 21), ("0", 22), ("Γ", 19), ("Ú", 17), ("2", 21), ("F", 23), ("Ζ", 19), ("4", 18), ("θ", 17), ("∟", 20)],
+    ),
+    Column(
+        x=220,
+        translate_values="0,-300;0,560",
+        translate_dur=5.8,
+        translate_begin=-3.2,
+        opacity_values="0.17;0.95;0.17",
+        opacity_dur=5.8,
+        opacity_begin=-3.2,
+        glyphs=[("F", 18), ("X", 21), ("!", 22), ("Φ", 19), ("Å", 17), ("%", 21), ("N", 23), ("Π", 19), ("œ", 18), ("μ", 17), ("∴", 20)],
+    ),
+    Column(
+        x=260,
+        translate_values="0,-260;0,520",
+        translate_dur=4.4,
+        translate_begin=-0.2,
+        opacity_values="0.24;0.93;0.24",
+        opacity_dur=4.4,
+        opacity_begin=-0.2,
+        glyphs=[("G", 18), ("Y", 21), ("@", 22), ("Υ", 19), ("Í", 17), ("ρ", 21), ("Æ", 23), ("W", 19), ("ħ", 18), ("ξ", 17), ("∠", 20)],
+    ),
+    Column(
+        x=300,
+        translate_values="0,-280;0,560",
+        translate_dur=5.0,
+        translate_begin=-1.1,
+        opacity_values="0.2;0.97;0.2",
+        opacity_dur=5.0,
+        opacity_begin=-1.1,
+        glyphs=[("ñ", 18), ("T", 21), ("8", 22), ("ϖ", 19), ("Ê", 17), ("σ", 21), ("Ğ", 23), ("V", 19), ("ň", 18), ("ς", 17), ("∵", 20)],
+    ),
+    Column(
+        x=340,
+        translate_values="0,-240;0,520",
+        translate_dur=4.3,
+        translate_begin=-2.7,
+        opacity_values="0.22;0.92;0.22",
+        opacity_dur=4.3,
+        opacity_begin=-2.7,
+        glyphs=[("I", 18), ("P", 21), ("6", 22), ("ϱ", 19), ("Ë", 17), ("ϙ", 21), ("Ð", 23), ("U", 19), ("ŕ", 18), ("Ϟ", 17), ("∗", 20)],
+    ),
+    Column(
+        x=380,
+        translate_values="0,-320;0,560",
+        translate_dur=5.6,
+        translate_begin=-1.5,
+        opacity_values="0.19;0.96;0.19",
+        opacity_dur=5.6,
+        opacity_begin=-1.5,
+        glyphs=[("¿", 18), ("N", 21), ("5", 22), ("ϗ", 19), ("Ę", 17), ("ϛ", 21), ("Ç", 23), ("R", 19), ("ś", 18), ("ϟ", 17), ("∯", 20)],
+    ),
+    Column(
+        x=420,
+        translate_values="0,-260;0,520",
+        translate_dur=4.5,
+        translate_begin=-0.9,
+        opacity_values="0.24;0.9;0.24",
+        opacity_dur=4.5,
+        opacity_begin=-0.9,
+        glyphs=[("K", 18), ("C", 21), ("4", 22), ("Ϥ", 19), ("Ě", 17), ("ϝ", 21), ("Ō", 23), ("S", 19), ("ž", 18), ("ϡ", 17), ("∼", 20)],
+    ),
+    Column(
+        x=460,
+        translate_values="0,-300;0,560",
+        translate_dur=5.2,
+        translate_begin=-2.5,
+        opacity_values="0.21;0.94;0.21",
+        opacity_dur=5.2,
+        opacity_begin=-2.5,
+        glyphs=[("ψ", 18), ("E", 21), ("3", 22), ("Θ", 19), ("Á", 17), ("Δ", 21), ("Š", 23), ("T", 19), ("ñ", 18), ("β", 17), ("⊕", 20)],
+    ),
 ]
 
 extra_glyph_cycle = [
@@ -612,11 +544,34 @@ ASSISTANT_GLYPH = ("∑AI", 20)
 SIGNATURE_GLYPHS = [K2_GLYPH, KTWO_GLYPH]
 
 
+@lru_cache(maxsize=8192)
 def fmt_num(value: float) -> str:
     text = f"{value:.2f}"
-    if text.endswith("00"):
+    if text[-1] != "0":
+        return text
+    if text[-2] == "0":
         return text[:-3]
-    return text.rstrip("0").rstrip(".")
+    return text[:-1]
+
+
+@lru_cache(maxsize=4096)
+def fmt_point(x: float, y: float) -> str:
+    """Format an ``x,y`` coordinate pair, e.g. for ``points`` or translate values."""
+
+    return f"{fmt_num(x)},{fmt_num(y)}"
+
+
+def fmt_seconds(value: float) -> str:
+    """Format a SMIL clock value, e.g. ``fmt_seconds(2.6) == "2.6s"``."""
+
+    return fmt_num(value) + "s"
+
+
+@lru_cache(maxsize=None)
+def escape_glyph(char: str) -> str:
+    """Escape a glyph for text content; the glyph alphabet is small and fixed."""
+
+    return escape(char)
 
 
 def generate_glyph_sequence(column_seed: int, base_glyphs, target_count: int):
@@ -655,178 +610,259 @@ translate_scales = [1.18, 0.82, 1.35, 0.87, 1.26, 0.79, 1.32, 0.9, 1.24, 0.84, 1
 opacity_scales = [1.12, 0.86, 1.3, 0.9, 1.18, 0.82, 1.24, 0.88, 1.16, 0.84, 1.22, 0.9]
 
 
-def build_matrix_rain(columns, nice_flags: dict[NiceFeature, bool]) -> ET.Element:
-    rain_group = ET.Element(
-        "g",
-        {
-            "id": "matrixRain",
-            "opacity": "0.95",
-            "font-family": "system-ui, sans-serif",
-            "letter-spacing": "2",
-        },
+RAIN_GROUP_OPEN = (
+    '<g id="matrixRain" opacity="0.95" fill="url(#gradGlow)" '
+    'font-family="system-ui, sans-serif" letter-spacing="2"'
+)
+
+
+def build_matrix_rain(
+    out: SvgWriter, columns, nice_flags: dict[NiceFeature, bool], jobs: int = 1
+) -> None:
+    """Write the rain group, streaming one column of glyph markup at a time.
+
+    The glyph subtree dwarfs the rest of the document, so ``iter_rain_columns``
+    renders it as raw SVG fragments that go straight to the writer.
+    """
+
+    if not columns:
+        out.section(RAIN_GROUP_OPEN + " />")
+        return
+
+    out.section(RAIN_GROUP_OPEN + ">")
+    write = out.write
+    for fragment in iter_rain_columns(columns, nice_flags, out.pretty, jobs):
+        write(fragment)
+    write("</g>")
+
+
+class PatternMarkup(NamedTuple):
+    """Per-pattern markup and offsets shared by every rain column."""
+
+    fill_static: tuple[str, ...]
+    fill_anim_prefixes: tuple[str, ...]
+    jitter_anim_prefixes: tuple[str, ...]
+    fill_begins: tuple[float, ...]
+    jitter_begins: tuple[float, ...]
+    size_begins: tuple[float, ...]
+
+
+@lru_cache(maxsize=None)
+def pattern_markup(anim_sep: str) -> PatternMarkup:
+    """Pre-render the pattern-dependent pieces of each glyph's animations."""
+
+    fill_static = []
+    for pattern in patterns:
+        fill_values_sequence = [float(value) for value in pattern.fill_values.split(';')]
+        fill_static.append(fmt_num(sum(fill_values_sequence) / len(fill_values_sequence)))
+    fill_static = tuple(fill_static)
+    # Per-pattern animation elements differ between glyphs only in ``begin``, so
+    # pre-render everything up to that attribute once.
+    fill_anim_prefixes = tuple(
+        f'{anim_sep}<animate attributeName="fill-opacity" '
+        f'values="{pattern.fill_values}" dur="{fmt_seconds(pattern.fill_dur)}" begin="'
+        for pattern in patterns
+    )
+    jitter_anim_prefixes = tuple(
+        f'{anim_sep}<animateTransform attributeName="transform" type="translate" '
+        f'values="{pattern.transform_values}" dur="{fmt_seconds(pattern.transform_dur)}" begin="'
+        for pattern in patterns
+    )
+    # Struct-of-arrays view of the begin offsets each column re-anchors.
+    return PatternMarkup(
+        fill_static,
+        fill_anim_prefixes,
+        jitter_anim_prefixes,
+        tuple(pattern.fill_begin for pattern in patterns),
+        tuple(pattern.transform_begin for pattern in patterns),
+        tuple(pattern.size_begin for pattern in patterns),
     )
 
-    for col_idx, col in enumerate(columns):
-        column_group = ET.SubElement(
-            rain_group,
-            "g",
-            {"transform": f'translate({fmt_num(col["x"])},0)'},
-        )
-        inner_attrs = {}
-        if not nice_flags[NiceFeature.DISABLE_TRAIL_FILTER]:
-            inner_attrs["filter"] = "url(#trailGlow)"
-        column_inner = ET.SubElement(column_group, "g", inner_attrs)
-
-        raw_offsets = (
-            float(value)
-            for pair in col["translate_values"].split(';')
-            for value in pair.split(',')
-        )
-        translate_pairs = [tuple(batch) for batch in batched(raw_offsets, 2) if len(batch) == 2]
-        start_offset_y = translate_pairs[0][1]
-        end_offset_y = translate_pairs[-1][1]
-
-        column_wave_base = (col_idx % COLUMN_WAVE_GROUP) * COLUMN_PHASE_STEP
-        column_wave_secondary = (col_idx // COLUMN_WAVE_GROUP) * COLUMN_PHASE_STEP * COLUMN_SECONDARY_FACTOR
-        column_wave_jitter = (((col_idx * 0.61803398875) % 1.0) - 0.5) * COLUMN_RANDOM_JITTER
-        column_anchor = column_wave_base + column_wave_secondary + column_wave_jitter
-
-        for glyph_idx, (char, size) in enumerate(col["glyphs"]):
-            base_y = 20 + glyph_idx * 40
-            pattern_idx = (glyph_idx + col_idx) % len(patterns)
-            pattern = patterns[pattern_idx]
-            micro_phase = (col_idx * 0.18 + glyph_idx * 0.07) * MICRO_PHASE_SCALE
-
-            start_y = base_y + start_offset_y
-            end_y = base_y + end_offset_y
-            start_translation = start_y - base_y
-            end_translation = end_y - base_y
-
-            fill_begin = pattern["fill_begin"] + column_anchor - micro_phase
-            jitter_begin = pattern["transform_begin"] + column_anchor - micro_phase * 0.8
-            size_begin = pattern["size_begin"] + column_anchor - micro_phase * 0.5
-            opacity_begin = col["opacity_begin"] + column_anchor - micro_phase * 0.6
-
-            fall_scale = 0.95 + 0.08 * (glyph_idx % 5) + 0.05 * (pattern_idx % 3)
-            fall_dur = col["translate_dur"] * fall_scale * VERTICAL_SPEED_FACTOR
-            fall_begin = col["translate_begin"] + column_anchor - micro_phase
-
-            opacity_scale = 0.9 + 0.04 * ((glyph_idx + 2 * col_idx) % 4)
-            opacity_dur = col["opacity_dur"] * opacity_scale
-
-            scale_high = (size + pattern["size_high"]) / size if size else 1.0
-            scale_low = (size + pattern["size_low"]) / size if size else 1.0
-            scale_high = max(scale_high, 0.2)
-            scale_low = max(scale_low, 0.2)
-            scale_values = ";".join(
-                fmt_num(value) for value in (1.0, scale_high, scale_low, 1.0)
-            )
 
-            opacity_values = col["opacity_values"].split(';')
-            peak_opacity = min(
-                0.98,
-                max(
-                    0.4,
-                    float(opacity_values[1])
-                    * (1.0 + 0.08 * ((glyph_idx % 3) - 1)),
-                ),
-            )
-            per_glyph_opacity = ";".join(
-                (fmt_num(0.08), fmt_num(peak_opacity), fmt_num(0.06))
-            )
+@lru_cache(maxsize=None)
+def scale_anim_prefix(size: int, pattern_idx: int, anim_sep: str) -> str:
+    """Pre-render a glyph's font-size pulse animation up to its ``begin`` value."""
+
+    pattern = patterns[pattern_idx]
+    scale_high = (size + pattern.size_high) / size if size else 1.0
+    scale_low = (size + pattern.size_low) / size if size else 1.0
+    scale_high = max(scale_high, 0.2)
+    scale_low = max(scale_low, 0.2)
+    scale_values = ";".join(fmt_num(value) for value in (1.0, scale_high, scale_low, 1.0))
+    return (
+        f'{anim_sep}<animateTransform attributeName="transform" type="scale" '
+        f'values="{scale_values}" dur="{fmt_seconds(pattern.size_dur)}" begin="'
+    )
+
+
+def render_column(
+    col_idx: int, col: Column, nice_flags: dict[NiceFeature, bool], pretty: bool = False
+) -> str:
+    """Render the markup of a single rain column.
+
+    Columns are independent of each other, so this is a plain top-level function
+    that worker processes can run as well.
+    """
 
-            fill_values_sequence = [
-                float(value) for value in pattern["fill_values"].split(';')
-            ]
-            fill_static = fmt_num(sum(fill_values_sequence) / len(fill_values_sequence))
-
-            text_attrs = {
-                "x": "0",
-                "y": fmt_num(base_y),
-                "fill": "url(#gradGlow)",
-                "font-size": fmt_num(size),
-                "transform": f'translate(0,{fmt_num(start_translation)})',
-            }
-
-            if nice_flags[NiceFeature.DISABLE_PER_GLYPH_OPACITY]:
-                text_attrs["opacity"] = fmt_num(peak_opacity)
-
-            if nice_flags[NiceFeature.DISABLE_FILL_OPACITY_PULSE]:
-                text_attrs["fill-opacity"] = fill_static
-
-            text_elem = ET.SubElement(column_inner, "text", text_attrs)
-            text_elem.text = char
-
-            ET.SubElement(
-                text_elem,
-                "animateTransform",
-                {
-                    "attributeName": "transform",
-                    "type": "translate",
-                    "values": f'0,{fmt_num(start_translation)};0,{fmt_num(end_translation)}',
-                    "dur": f"{fmt_num(fall_dur)}s",
-                    "begin": f"{fmt_num(fall_begin)}s",
-                    "repeatCount": "indefinite",
-                },
+    column_sep, inner_sep, glyph_sep, anim_sep = RAIN_SEPARATORS[pretty]
+    markup = pattern_markup(anim_sep)
+    pattern_count = len(patterns)
+    fill_pulse = not nice_flags[NiceFeature.DISABLE_FILL_OPACITY_PULSE]
+    glyph_opacity = not nice_flags[NiceFeature.DISABLE_PER_GLYPH_OPACITY]
+    size_pulse = not nice_flags[NiceFeature.DISABLE_FONT_SIZE_ANIMATION]
+    micro_jitter = not nice_flags[NiceFeature.DISABLE_MICRO_JITTER]
+    inner_open = (
+        "<g>" if nice_flags[NiceFeature.DISABLE_TRAIL_FILTER] else '<g filter="url(#trailGlow)">'
+    )
+
+    parts: list[str] = []
+    append = parts.append
+    append(f'{column_sep}<g transform="translate({fmt_num(col.x)},0)">{inner_sep}{inner_open}')
+
+    raw_offsets = (
+        float(value)
+        for pair in col.translate_values.split(';')
+        for value in pair.split(',')
+    )
+    translate_pairs = [tuple(batch) for batch in batched(raw_offsets, 2) if len(batch) == 2]
+    start_offset_y = translate_pairs[0][1]
+    end_offset_y = translate_pairs[-1][1]
+
+    column_wave_base = (col_idx % COLUMN_WAVE_GROUP) * COLUMN_PHASE_STEP
+    column_wave_secondary = (col_idx // COLUMN_WAVE_GROUP) * COLUMN_PHASE_STEP * COLUMN_SECONDARY_FACTOR
+    column_wave_jitter = (((col_idx * 0.61803398875) % 1.0) - 0.5) * COLUMN_RANDOM_JITTER
+    column_anchor = column_wave_base + column_wave_secondary + column_wave_jitter
+    column_phase = col_idx * 0.18
+
+    # Most per-glyph terms only vary with small moduli of the glyph/pattern
+    # index, so resolve them into per-column lookup tables up front.
+    start_text = fmt_num(start_offset_y)
+    fall_values = f"{fmt_point(0, start_offset_y)};{fmt_point(0, end_offset_y)}"
+    fall_anim_prefixes = [
+        [
+            '<animateTransform attributeName="transform" type="translate" '
+            f'values="{fall_values}" dur="{fmt_seconds(fall_dur)}" begin="'
+            for fall_dur in (
+                col.translate_dur * (0.95 + 0.08 * glyph_mod + 0.05 * pattern_mod) * VERTICAL_SPEED_FACTOR
+                for pattern_mod in range(3)
             )
+        ]
+        for glyph_mod in range(5)
+    ]
+    fall_begin_base = col.translate_begin + column_anchor
+    opacity_begin_base = col.opacity_begin + column_anchor
+    peak_opacity_base = float(col.opacity_values.split(';')[1])
+    peak_opacity_texts = [
+        fmt_num(min(0.98, max(0.4, peak_opacity_base * (1.0 + 0.08 * (step - 1)))))
+        for step in range(3)
+    ]
+    opacity_anim_prefixes = [
+        [
+            f'{anim_sep}<animate attributeName="opacity" '
+            f'values="{fmt_num(0.08)};{peak_text};{fmt_num(0.06)}" '
+            f'dur="{fmt_seconds(col.opacity_dur * (0.9 + 0.04 * step))}" begin="'
+            for step in range(4)
+        ]
+        for peak_text in peak_opacity_texts
+    ]
+    fill_begin_bases = [begin + column_anchor for begin in markup.fill_begins]
+    jitter_begin_bases = [begin + column_anchor for begin in markup.jitter_begins]
+    size_begin_bases = [begin + column_anchor for begin in markup.size_begins]
+    fill_anim_prefixes = markup.fill_anim_prefixes
+    jitter_anim_prefixes = markup.jitter_anim_prefixes
+    text_close = f"{glyph_sep}</text>"
+
+    for glyph_idx, (char, size) in enumerate(col.glyphs):
+        base_y = 20 + glyph_idx * 40
+        pattern_idx = (glyph_idx + col_idx) % pattern_count
+        micro_phase = (column_phase + glyph_idx * 0.07) * MICRO_PHASE_SCALE
+
+        fill_begin = fill_begin_bases[pattern_idx] - micro_phase
+        jitter_begin = jitter_begin_bases[pattern_idx] - micro_phase * 0.8
+        size_begin = size_begin_bases[pattern_idx] - micro_phase * 0.5
+        glyph_opacity_begin = opacity_begin_base - micro_phase * 0.6
+        fall_begin = fall_begin_base - micro_phase
+        peak_step = glyph_idx % 3
+
+        extra_attrs = ""
+        if not glyph_opacity:
+            extra_attrs += f' opacity="{peak_opacity_texts[peak_step]}"'
+
+        if not fill_pulse:
+            extra_attrs += f' fill-opacity="{markup.fill_static[pattern_idx]}"'
+
+        # Row offsets and glyph sizes are ints, so they skip fmt_num.
+        append(
+            f'{glyph_sep}<text y="{base_y}" font-size="{size}" '
+            f'transform="translate(0,{start_text})"'
+            f'{extra_attrs}>{escape_glyph(char)}'
+        )
 
-            if not nice_flags[NiceFeature.DISABLE_FILL_OPACITY_PULSE]:
-                ET.SubElement(
-                    text_elem,
-                    "animate",
-                    {
-                        "attributeName": "fill-opacity",
-                        "values": pattern["fill_values"],
-                        "dur": f"{fmt_num(pattern['fill_dur'])}s",
-                        "begin": f"{fmt_num(fill_begin)}s",
-                        "repeatCount": "indefinite",
-                    },
-                )
+        append(fall_anim_prefixes[glyph_idx % 5][pattern_idx % 3])
+        append(fmt_num(fall_begin))
+        append(ANIMATE_CLOSE)
 
-            if not nice_flags[NiceFeature.DISABLE_PER_GLYPH_OPACITY]:
-                ET.SubElement(
-                    text_elem,
-                    "animate",
-                    {
-                        "attributeName": "opacity",
-                        "values": per_glyph_opacity,
-                        "dur": f"{fmt_num(opacity_dur)}s",
-                        "begin": f"{fmt_num(opacity_begin)}s",
-                        "repeatCount": "indefinite",
-                    },
-                )
+        if fill_pulse:
+            append(fill_anim_prefixes[pattern_idx])
+            append(fmt_num(fill_begin))
+            append(ANIMATE_CLOSE)
 
-            if not nice_flags[NiceFeature.DISABLE_FONT_SIZE_ANIMATION]:
-                ET.SubElement(
-                    text_elem,
-                    "animateTransform",
-                    {
-                        "attributeName": "transform",
-                        "type": "scale",
-                        "values": scale_values,
-                        "dur": f"{fmt_num(pattern['size_dur'])}s",
-                        "begin": f"{fmt_num(size_begin)}s",
-                        "repeatCount": "indefinite",
-                        "additive": "sum",
-                    },
-                )
+        if glyph_opacity:
+            append(opacity_anim_prefixes[peak_step][(glyph_idx + 2 * col_idx) % 4])
+            append(fmt_num(glyph_opacity_begin))
+            append(ANIMATE_CLOSE)
+
+        if size_pulse:
+            append(scale_anim_prefix(size, pattern_idx, anim_sep))
+            append(fmt_num(size_begin))
+            append(ADDITIVE_ANIMATE_CLOSE)
 
-            if not nice_flags[NiceFeature.DISABLE_MICRO_JITTER]:
-                ET.SubElement(
-                    text_elem,
-                    "animateTransform",
-                    {
-                        "attributeName": "transform",
-                        "type": "translate",
-                        "values": pattern["transform_values"],
-                        "dur": f"{fmt_num(pattern['transform_dur'])}s",
-                        "begin": f"{fmt_num(jitter_begin)}s",
-                        "repeatCount": "indefinite",
-                        "additive": "sum",
-                    },
+        if micro_jitter:
+            append(jitter_anim_prefixes[pattern_idx])
+            append(fmt_num(jitter_begin))
+            append(ADDITIVE_ANIMATE_CLOSE)
+
+        append(text_close)
+
+    append(f"{inner_sep}</g>{column_sep}</g>")
+    return "".join(parts)
+
+
+def iter_rain_columns(
+    columns, nice_flags: dict[NiceFeature, bool], pretty: bool = False, jobs: int = 1
+) -> Iterator[str]:
+    """Yield the rendered markup of each rain column, one column at a time.
+
+    With ``pretty`` the fragments are indented to match the surrounding
+    scaffold; otherwise no whitespace is emitted between tags. With
+    ``jobs > 1`` columns are rendered across that many worker processes and
+    still yielded in document order, with at most ``2 * jobs`` columns in
+    flight at once.
+    """
+
+    if jobs > 1 and len(columns) > 1:
+        # Imported lazily: pulling in multiprocessing costs more than a default render.
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Keep only a small window of columns in flight so finished markup does
+        # not pile up ahead of a slow writer.
+        window = 2 * jobs
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            pending = deque()
+            for col_idx, col in enumerate(columns):
+                pending.append(
+                    executor.submit(render_column, col_idx, col, nice_flags, pretty)
                 )
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    else:
+        for col_idx, col in enumerate(columns):
+            yield render_column(col_idx, col, nice_flags, pretty)
 
-    return rain_group
+    if columns and pretty:
+        yield "\n  "
 
 
 def build_columns(
@@ -845,20 +881,23 @@ def build_columns(
     min_span_width = max(0.0, base_canvas_width - 2 * EDGE_MARGIN)
     span_width = max(min_span_width, (total_columns - 1) * COLUMN_BASE_SPACING)
 
-    def pick_glyph_target() -> int:
-        if min_gps == max_gps:
-            return min_gps
-        return rng.randint(min_gps, max_gps)
+    # Draw every column's glyph count in one pass, in column order, so the seeded
+    # sequence matches the per-column draws it replaces.
+    regular_total = max(0, regular_count)
+    target_total = regular_total + max(0, irregular_count)
+    if min_gps == max_gps:
+        glyph_targets = [min_gps] * target_total
+    else:
+        randint = rng.randint
+        glyph_targets = [randint(min_gps, max_gps) for _ in range(target_total)]
 
-    for idx in range(max(0, regular_count)):
-        template = deepcopy(base_columns[idx % base_len])
-        if regular_count == 1:
-            template["x"] = span_width / 2
-        else:
-            template["x"] = (span_width / max(regular_count - 1, 1)) * idx
-        target_count = pick_glyph_target()
-        template["glyphs"] = generate_glyph_sequence(idx, template["glyphs"], target_count)
-        columns.append(template)
+    # Lay out every x position as one flat list first and normalize it, so each
+    # Column below is built once with its final position.
+    if regular_count == 1:
+        raw_xs = [span_width / 2] * regular_total
+    else:
+        regular_step = span_width / max(regular_count - 1, 1)
+        raw_xs = [regular_step * idx for idx in range(regular_total)]
 
     offset_min = min(irregular_offsets) if irregular_offsets else 0.0
     offset_max = max(irregular_offsets) if irregular_offsets else 1.0
@@ -915,8 +954,7 @@ def build_columns(
     if total_columns > 0:
         edge_padding_ratio = min(0.08, 0.5 / total_columns)
 
-    for idx, offset_idx in enumerate(irregular_indices):
-        template = deepcopy(base_columns[idx % base_len])
+    for offset_idx in irregular_indices:
         if offset_max == offset_min:
             normalized = 0.5
         else:
@@ -924,35 +962,75 @@ def build_columns(
         if edge_padding_ratio > 0:
             normalized = normalized * (1 - 2 * edge_padding_ratio) + edge_padding_ratio
             normalized = max(0.0, min(1.0, normalized))
-        template["x"] = normalized * span_width
-        shift = phase_shifts[offset_idx]
-        template["translate_begin"] += shift
-        template["opacity_begin"] += shift * 0.65
-        template["translate_dur"] *= translate_scales[offset_idx]
-        template["opacity_dur"] *= opacity_scales[offset_idx]
-        target_count = pick_glyph_target()
-        template["glyphs"] = generate_glyph_sequence(idx + regular_count, template["glyphs"], target_count)
-        columns.append(template)
-
-    if columns:
-        xs = [col["x"] for col in columns]
-        min_x = min(xs)
-        max_x = max(xs)
+        raw_xs.append(normalized * span_width)
+
+    if raw_xs:
+        min_x = min(raw_xs)
+        max_x = max(raw_xs)
         if max_x == min_x:
-            normalized_positions = [span_width / 2.0 for _ in xs]
+            xs = [span_width / 2.0 + EDGE_MARGIN] * len(raw_xs)
         else:
             scale = span_width / (max_x - min_x)
-            normalized_positions = [(x - min_x) * scale for x in xs]
-        for col, new_x in zip(columns, normalized_positions):
-            col["x"] = new_x + EDGE_MARGIN
+            xs = [(x - min_x) * scale + EDGE_MARGIN for x in raw_xs]
         canvas_width = span_width + 2 * EDGE_MARGIN
     else:
+        xs = []
         canvas_width = max(base_canvas_width, DEFAULT_CANVAS_WIDTH)
 
+    for idx in range(regular_total):
+        template = base_columns[idx % base_len]
+        glyphs = generate_glyph_sequence(idx, template.glyphs, glyph_targets[idx])
+        columns.append(template._replace(x=xs[idx], glyphs=glyphs))
+
+    for idx, offset_idx in enumerate(irregular_indices):
+        template = base_columns[idx % base_len]
+        shift = phase_shifts[offset_idx]
+        glyphs = generate_glyph_sequence(
+            idx + regular_count, template.glyphs, glyph_targets[regular_total + idx]
+        )
+        columns.append(
+            template._replace(
+                x=xs[regular_total + idx],
+                translate_begin=template.translate_begin + shift,
+                opacity_begin=template.opacity_begin + shift * 0.65,
+                translate_dur=template.translate_dur * translate_scales[offset_idx],
+                opacity_dur=template.opacity_dur * opacity_scales[offset_idx],
+                glyphs=glyphs,
+            )
+        )
+
     return columns, canvas_width
 
 
-def build_svg(
+def clamp_scene_options(
+    nice_level: int,
+    gps_min: int,
+    gps_max: int,
+    regular_columns: Optional[int],
+    irregular_columns: Optional[int],
+    base_canvas_width: float,
+) -> tuple[int, int, int, int, int, float]:
+    """Fill in default column counts and clamp the scene options to valid ranges."""
+
+    nice_level = resolve_nice_flags(nice_level)[0]
+
+    gps_min = 1 if gps_min < 1 else gps_min
+    gps_max = gps_min if gps_max < gps_min else gps_max
+
+    if regular_columns is None:
+        regular_columns = len(base_columns)
+    if irregular_columns is None:
+        irregular_columns = len(base_columns)
+
+    regular_columns = 0 if regular_columns < 0 else regular_columns
+    irregular_columns = 0 if irregular_columns < 0 else irregular_columns
+
+    base_canvas_width = 100.0 if base_canvas_width < 100.0 else float(base_canvas_width)
+    return nice_level, gps_min, gps_max, regular_columns, irregular_columns, base_canvas_width
+
+
+def write_svg(
+    write: Callable[[str], object],
     include_lightning: bool = True,
     nice_level: int = 0,
     gps_min: int = 22,
@@ -961,21 +1039,23 @@ def build_svg(
     irregular_columns: Optional[int] = None,
     include_metadata: bool = True,
     base_canvas_width: float = DEFAULT_CANVAS_WIDTH,
-) -> str:
-    nice_level, nice_flags = resolve_nice_flags(nice_level)
-
-    gps_min = max(1, gps_min)
-    gps_max = max(gps_min, gps_max)
-
-    if regular_columns is None:
-        regular_columns = len(base_columns)
-    if irregular_columns is None:
-        irregular_columns = len(base_columns)
-
-    regular_columns = max(0, regular_columns)
-    irregular_columns = max(0, irregular_columns)
+    pretty: bool = False,
+    jobs: int = 1,
+) -> None:
+    """Write the SVG document through ``write`` as a sequence of markup chunks.
+
+    Writing straight to a stream holds a single column of glyph markup in
+    memory, or at most ``2 * jobs`` finished columns when ``jobs`` spreads
+    column rendering over worker processes. Markup is compact unless
+    ``pretty`` asks for indentation.
+    """
 
-    base_canvas_width = max(base_canvas_width, 100.0)
+    nice_level, gps_min, gps_max, regular_columns, irregular_columns, base_canvas_width = (
+        clamp_scene_options(
+            nice_level, gps_min, gps_max, regular_columns, irregular_columns, base_canvas_width
+        )
+    )
+    nice_flags = NICE_FLAGS_BY_LEVEL[nice_level]
     columns, canvas_width = build_columns(
         gps_min,
         gps_max,
@@ -985,30 +1065,91 @@ def build_svg(
     )
     include_lightning = include_lightning and not nice_flags[NiceFeature.DISABLE_LIGHTNING]
 
+    out = SvgWriter(write, pretty)
     width_text = fmt_num(canvas_width)
-    svg_attrs = {
-        "xmlns": SVG_NS,
-        "width": width_text,
-        "height": "500",
-        "viewBox": f"0 0 {width_text} 500",
-        "style": "width:100%;height:auto;",
-        "aria-label": "Animated neon glyph waterfall",
-        "role": "img",
-        "focusable": "true",
-    }
-
-    svg_root = ET.Element("svg", svg_attrs)
+    write(
+        f'<svg xmlns="{SVG_NS}" width="{width_text}" height="500" '
+        f'viewBox="0 0 {width_text} 500" style="width:100%;height:auto;" '
+        'aria-label="Animated neon glyph waterfall" role="img" focusable="true">'
+    )
     if include_metadata:
-        svg_root.append(build_metadata())
-    svg_root.append(build_style())
-    svg_root.append(build_defs())
-    add_background_rects(svg_root, canvas_width)
-    svg_root.append(build_matrix_rain(columns, nice_flags))
+        out.section(METADATA_SECTION[pretty])
+    out.section(STYLE_SECTION[pretty])
+    out.section(
+        defs_section(
+            bool(columns) and not nice_flags[NiceFeature.DISABLE_TRAIL_FILTER],
+            include_lightning,
+            pretty,
+        )
+    )
+    build_background_rects(out, canvas_width)
+    build_matrix_rain(out, columns, nice_flags, jobs)
     if include_lightning:
-        svg_root.append(build_lightning(canvas_width))
+        build_lightning(out, canvas_width)
+    write("\n</svg>" if pretty else "</svg>")
+
+
+# Documents rendered by build_svg, keyed by the options that shape the output
+# and kept in least-recently-used order.
+SVG_CACHE_SIZE = 8
+_svg_cache: OrderedDict[tuple, str] = OrderedDict()
+_svg_cache_lock = threading.Lock()
+
+
+def build_svg(
+    include_lightning: bool = True,
+    nice_level: int = 0,
+    gps_min: int = 22,
+    gps_max: int = 22,
+    regular_columns: Optional[int] = None,
+    irregular_columns: Optional[int] = None,
+    include_metadata: bool = True,
+    base_canvas_width: float = DEFAULT_CANVAS_WIDTH,
+    pretty: bool = False,
+    jobs: int = 1,
+) -> str:
+    """Render the whole SVG document to a string; see ``write_svg`` for the options.
 
-    indent(svg_root)
-    return ET.tostring(svg_root, encoding="unicode")
+    The document is fully determined by the options other than ``jobs``, so
+    repeated calls return a cached string. Up to ``SVG_CACHE_SIZE`` documents
+    stay alive for the life of the process; use ``write_svg`` directly when
+    that matters.
+    """
+
+    nice_level, gps_min, gps_max, regular_columns, irregular_columns, base_canvas_width = (
+        clamp_scene_options(
+            nice_level, gps_min, gps_max, regular_columns, irregular_columns, base_canvas_width
+        )
+    )
+    options = dict(
+        include_lightning=include_lightning,
+        nice_level=nice_level,
+        gps_min=gps_min,
+        gps_max=gps_max,
+        regular_columns=regular_columns,
+        irregular_columns=irregular_columns,
+        include_metadata=include_metadata,
+        base_canvas_width=base_canvas_width,
+        pretty=pretty,
+    )
+    key = tuple(options.values())
+    with _svg_cache_lock:
+        document = _svg_cache.get(key)
+        if document is not None:
+            _svg_cache.move_to_end(key)
+            return document
+
+    # Render outside the lock so concurrent misses do not serialize; a racing
+    # thread may render the same document, and the last insert wins.
+    parts: list[str] = []
+    write_svg(parts.append, jobs=jobs, **options)
+    document = "".join(parts)
+    with _svg_cache_lock:
+        _svg_cache[key] = document
+        _svg_cache.move_to_end(key)
+        if len(_svg_cache) > SVG_CACHE_SIZE:
+            _svg_cache.popitem(last=False)
+    return document
 
 
 def parse_args():
@@ -1085,6 +1226,20 @@ def parse_args():
             "and uses five regular plus two irregular strands)."
         ),
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the SVG markup for readability (noticeably larger output).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Render rain columns across this many worker processes. Only pays off for very "
+            "large scenes (hundreds of long strands); process start-up dominates otherwise."
+        ),
+    )
     parser.add_argument(
         "--width-offset",
         type=float,
@@ -1107,6 +1262,8 @@ def parse_args():
         parser.error("--columns-regular must be >= 0")
     if args.columns_irregular < 0:
         parser.error("--columns-irregular must be >= 0")
+    if args.jobs < 1:
+        parser.error("--jobs must be >= 1")
 
     base_width = DEFAULT_CANVAS_WIDTH + args.width_offset
     if base_width < 100.0:
@@ -1129,6 +1286,8 @@ def main():
         "irregular_columns": args.columns_irregular,
         "include_metadata": not args.no_metadata,
         "base_canvas_width": args.canvas_width,
+        "pretty": args.pretty,
+        "jobs": args.jobs,
     }
 
     if args.preview:
@@ -1142,8 +1301,8 @@ def main():
             include_metadata=False,
         )
 
-    svg = build_svg(**config)
-    print(svg)
+    write_svg(sys.stdout.write, **config)
+    sys.stdout.write("\n")
 
 
 if __name__ == "__main__":